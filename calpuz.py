@@ -1,228 +1,183 @@
 #!/usr/bin/python3
 
 import sys
-import os
 from datetime import datetime
+import multiprocessing
 import time
-from copy import deepcopy
 
-quiet = False
 gonogo = False
 
+DEBUG = False   # set True to dump the board whenever piece 1 is (re)placed
+
+# Translation tables for dumps, applied to the whole rendering in one call.
+BOARD_TBL = str.maketrans('0', '.')     # empty board spots render as '.'
+PIECE_TBL = str.maketrans('01', '.X')   # piece patterns render as 'X' blocks
+
+##
+ # Board-mask bit for a given (row, col) spot.
+ ##
+def spotBit(row, col):
+    return 1 << (row * 7 + col)
+
+# Spots that are never placeable, plus the spot for each month and day, as
+# ready-made masks - board setup is then a single OR of three constants.
+UNUSABLE_MASK = spotBit(0, 6) | spotBit(1, 6) \
+    | spotBit(6, 3) | spotBit(6, 4) | spotBit(6, 5) | spotBit(6, 6)
+MONTH_BIT = tuple(spotBit(m // 6, m % 6) for m in range(12))
+DAY_BIT = tuple(spotBit(2 + d // 7, d % 7) for d in range(31))
+
 ##
  # Define a "board" object, which represents places to put all the pieces.
- # Any spots on the board that are not placeable are set to 1.
- # The spots on the board for the month and day are set to 1.
- # All other spots are left at zero.
- # Placing a piece on the board adds it's pattern for each spot it covers,
- # and any spot > 1 represents an overlap, either with unplaceable spots,
- # OR with already placed pieces.
+ # The board is a single integer bitmask, one bit per spot, bit (row*7+col)
+ # set when that spot is covered. Spots that are not placeable, and the spots
+ # for the month and day, have their bits set up front.
+ # Placing a piece ORs its pattern into the mask; any overlap, either with
+ # unplaceable spots OR with already placed pieces, shows up as a nonzero
+ # AND between the board mask and the piece mask.
  ##
 class Board:
+    __slots__ = ('width', 'height', 'month', 'day', 'locations', 'full',
+                 'leftCol', 'rightCol', 'mask', 'placed', 'blocked')
+
     def __init__(self, month, day):
         self.width = 7
         self.height = 7
         self.month = month
         self.day = day
         self.locations = self.width * self.height
-        self.hid = 0
+        self.full = (1 << self.locations) - 1   # mask with every board bit set
+
+        # Column edge masks, for neighbor shifts that must not wrap between rows.
+        leftCol = 0
+        for row in range(self.height):
+            leftCol |= 1 << (row * self.width)
+        self.leftCol = leftCol
+        self.rightCol = leftCol << (self.width - 1)
 
         self.reset()
 
     def reset(self):
-        # Represent board as 2D array.
-        self.rows = [[0]*self.height for i in range(self.width)]
-
-        # Establish unusable spots on the board.
-        self.rows[0][6] = 9
-        self.rows[1][6] = 9
-        self.rows[6][3] = 9
-        self.rows[6][4] = 9
-        self.rows[6][5] = 9
-        self.rows[6][6] = 9
-
-        # Mark spots on board for date given, as these should not be covered.
-        self.setDate()
-
-    ##
-     # Locate and group contiguous voids on the board, and report the smallest group.
-     # Used to determine if a void has been created that no part could possibly
-     # fit into, for the purpose of pruning fit() recursive branches.
-     ##
-    def smallestVoid(self):
-        groupId = 0    # 0-based current group ID, incremented for each unique found
-        spotGroups = [-1] * self.width*self.height      # 0-based group ID assignments for each spot on the board
-        groupCounts = [0] * self.width*self.height      # count of spots for each group
-
-        # Walk down each column to look for adjacent void spots, and start counts for each group found.
-        for cidx in range (len(self.rows[0])):
-            for ridx in range (len(self.rows)):
-                pos = self.linearFromCoord(cidx, ridx)      # linear position for current spot
-                if ridx == 0:
-                    # First row: if zero, start a new group.
-                    if self.rows[ridx][cidx] == 0:
-                        spotGroups[pos] = groupId
-                        groupCounts[spotGroups[pos]] = 1
-                        groupId += 1
-                else:
-                    # Succeeding rows.
-                    if self.rows[ridx][cidx] == 0:
-                        ppos = self.linearFromCoord(cidx, ridx-1)   # linear position for spot above
-                        if self.rows[ridx-1][cidx] == 0:
-                            # If spot above is void, add to its group.
-                            spotGroups[pos] = spotGroups[ppos]              # assign existing group to this position
-                            groupCounts[spotGroups[ppos]] += 1              # add 1 spot to existing group
-                        else:
-                            # New void: start new group
-                            spotGroups[pos] = groupId   # start new group
-                            groupCounts[spotGroups[pos]] = 1   # start 1 spot for new group
-                            groupId += 1                # increment group ID
-
-        # Walk across each row, combining adjacent voids groups.
-        # Note all voids have been assigned groups, above - now we're looking for adjacent horizontally.
-        for ridx in range (len(self.rows)):
-            for cidx in range (1, len(self.rows[0])):
-                pos = self.linearFromCoord(cidx, ridx)      # linear position for current spot
-                if self.rows[ridx][cidx] == 0:
-                    ppos = self.linearFromCoord(cidx-1, ridx)   # linear position for spot to left
-                    if self.rows[ridx][cidx-1] == 0:
-                        toGroup = spotGroups[ppos]
-                        fromGroup = spotGroups[pos]
-                        # If void, and if not already in same group, combine with void group to the left.
-                        if fromGroup != toGroup:
-                            for i in range(self.locations):
-                                if spotGroups[i] == fromGroup:
-                                    groupCounts[toGroup] += 1  # add to existing group
-                                    spotGroups[i] = spotGroups[ppos]
-                            groupCounts[fromGroup] = 0    # zero-out group combined
-
-        # # Debug: dump group mapping
-        # print('\nMNMNMNMNMN')
-        # for i in range(self.locations):
-        #     if i and i % self.width == 0:
-        #         sys.stdout.write('\n')
-        #     if spotGroups[i] == -1:
-        #         sys.stdout.write('X')
-        #     else:
-        #         sys.stdout.write(chr(spotGroups[i] + ord('a')))
-
-        # Find and return the smallest group of voids
-        smallest = sys.maxsize
-        for i in range(groupId):
-            if groupCounts[i] and (groupCounts[i] < smallest):
-                smallest = groupCounts[i]
-        return smallest
-
-    # Mark spots on board for month and day that can't be covered.
-    def setDate(self):
-        m = self.month - 1  # get 0-based month {0..11}
-        d = self.day - 1    # get 0-based day of month {0..20}
-        self.rows[int(m / 6)][int(m % 6)] = 9
-        self.rows[int(2 + d/7)][int(d % 7)] = 9
-
-    ##
-     # Place a piece on the board.
-     # The piece rotation is already established before passing it to this method, so we don't worry about that here.
-     # \param piece piece object to be placed
-     # \param pos linear location - this is 0 at (0,0), incrementing across each column, then down each row
-     # \returns True if valid - fits in board and does not overlap any invalid spot or other piece already placed
-     ##
-    def place(self, piece, pos):
-        # Copy board, in case we fail to place the part.
-        brdCopy = deepcopy(self.rows)
-
-        # Derive coord of piece upper-left corner from linear location
-        x0, y0 = self.coordFromLinear(pos)
-
-        # Invalid if piece rectangle goes outside of board rectangle. This should be true regardless
-        # of the actual shape of the piece.
-        if (x0 + piece.width) > self.width or (y0 + piece.height) > self.height:
-            return False
-
-        # Superimpose piece onto board, by simpy adding it's ID to overlapping spots.
-        for y in range(len(piece.rows)):
-            for x in range(len(piece.rows[0])):
-                # If piece would overlap an invalid spot, or another piece, restore board and return failure.
-                if piece.rows[y][x] and self.rows[y0+y][x0+x]:
-                    self.rows = deepcopy(brdCopy)
-                    return False
-                # Continue to fill piece into board.
-                self.rows[y0+y][x0+x] += piece.rows[y][x] * piece.id
-
-        # Check for too-small voids left by part, and disqualify if any found for the part.
-        MIN_VOID_COUNT = 5          # minimum contiguous voids, since the smallest part overlaps 5 spots
-        minVoid = self.smallestVoid()
-        if minVoid < MIN_VOID_COUNT:
-            self.remove(piece, pos)
-            return False
+        # Represent board as one bitmask, bit (row*7+col) per spot: the
+        # unusable spots, plus the spots for the date given, as these should
+        # not be covered.
+        self.mask = UNUSABLE_MASK | MONTH_BIT[self.month - 1] | DAY_BIT[self.day - 1]
+        self.placed = {}    # shifted piece mask -> piece ID, for dumps only
 
-        # Return successful placement.
-        return True
+        # Remember which bits are blocked for good, so dumps can tell them apart.
+        self.blocked = self.mask
 
     ##
-     # Place a an 'X' mark on the given location on the board. Used to count voids and debugging.
+     # Determine whether any contiguous group of voids on the board has a size
+     # that no subset of the remaining pieces can exactly fill, meaning a void
+     # has been created that can never be covered, for the purpose of pruning
+     # fit() recursive branches. The fillable sizes are passed as a bitset
+     # (bit N set when some subset of the remaining pieces covers N spots).
+     # Flood-fills each group directly on the board mask, and stops as soon as
+     # one infeasible group is found.
      ##
-    def mark(self, col, row):
-        if self.rows[row][col] == 0:
-            self.rows[row][col] = 'X'
+    def hasInfeasibleVoid(self, sums):
+        free = ~self.mask & self.full
+        notLeft = ~self.leftCol
+        notRight = ~self.rightCol
+        width = self.width
+        while free:
+            # Grow a group outward from the lowest remaining void spot by
+            # dilating the whole group mask a step at a time - four shifts and
+            # an AND against the free spots - until it stops expanding.
+            group = free & -free
+            while True:
+                grown = (group | (group << 1 & notLeft) | (group >> 1 & notRight) \
+                    | group << width | group >> width) & free
+                if grown == group:
+                    break
+                group = grown
+            if not sums >> group.bit_count() & 1:
+                return True
+            free ^= group
+        return False
 
     ##
-     # Remove any alpha "marks" from the board, used for counting voids and debugging.
+     # Quick check for an empty spot whose four neighbors are all covered.
+     # Such an orphan spot can never be filled by any piece, so a placement that
+     # creates one can be rejected without running the full void count.
      ##
-    def removeMarks(self):
-        for y in range(len(self.rows)):
-            for x in range(len(self.rows[0])):
-                if self.rows[y][x] == 'X':
-                    self.rows[y][x] = 0
+    def hasOrphanVoid(self):
+        free = ~self.mask & self.full
+        # OR together the neighbors of every free spot, masking off shifts that
+        # would wrap between rows.
+        reach = (free << 1 & ~self.leftCol) | (free >> 1 & ~self.rightCol) \
+            | (free << self.width) | (free >> self.width)
+        return free & ~reach != 0
 
     ##
-     # Assuming the given piece has already been placed at the given location, remove the piece.
-     # Caution: only call to remove a piece that is known to be at a given location - this is not checked.
+     # Place a piece on the board.
      # \param piece piece object to be placed
-     # \param x linear location - this is 0 at (0,0), incrementing across each column, then down each row
+     # \param shifted one of the piece's precomputed placement masks, already shifted into board position
+     # \param sums bitset of void sizes the remaining pieces can fill, see achievableSums()
+     # \returns the shifted piece mask if valid - does not overlap any invalid spot or other piece
+     #          already placed - or zero on failure. Pass the mask back to remove() to undo.
      ##
-    def remove(self, piece, x):
-
-        # Derive coord of piece upper-left corner from linear location
-        x0, y0 = self.coordFromLinear(x)
-
-        # Remove piece by subtracting out its pattern.
-        for y in range(len(piece.rows)):
-            for x in range(len(piece.rows[0])):
-                self.rows[y0+y][x0+x] -= piece.rows[y][x] * piece.id
+    def place(self, piece, shifted, sums):
+        # The placement masks are precomputed to fit inside the board rectangle, so any
+        # overlap with an invalid spot, or another piece, shows up in a single AND.
+        if self.mask & shifted:
+            return 0
+        self.mask |= shifted
+
+        # Fast reject: a lone empty spot boxed in on all four sides can never be
+        # filled, and is a handful of shift/AND ops to detect.
+        if self.hasOrphanVoid():
+            self.mask ^= shifted
+            return 0
+
+        # Check for voids left by the part that the remaining pieces cannot
+        # exactly fill, and disqualify the placement if any found.
+        if self.hasInfeasibleVoid(sums):
+            self.mask ^= shifted
+            return 0
+
+        # Remember the piece ID covering these spots, for dumps.
+        self.placed[shifted] = piece.id
 
-    ##
-     # Scans all board spots, and return True only if no overlaps are detected.
-     ##
-    def isBoardValid(self):
-        for r in self.rows:
-            for c in r:
-                if c > 1:
-                    return False
-        return True
+        # Return successful placement.
+        return shifted
 
     ##
-     # Determine if a given coordinate on the board is "placeable", by the following criteria:
-     #      o Must be within the boundaries of the board rectangle (not out of bounds of self.rows[][])
-     #      o Must not be on an excluded/reserved spot, or selected for month or date (contains '9'), or overlapped by a placed piece
+     # Remove a previously placed piece from the board.
+     # Caution: only call with a mask returned by a successful place() - this is not checked.
+     # \param shifted the shifted piece mask returned by place()
      ##
-    def isPlaceable(self, row, col):
-        return (row >= 0) and (col >= 0) and (row < self.width) and (col < self.height) and (self.rows[row][col] == 0)
+    def remove(self, shifted):
+        self.mask ^= shifted
+        del self.placed[shifted]
 
     def dump(self):
-        for r in self.rows:
-            for c in r:
-                if c <= 9:
-                    sys.stdout.write(str(c))
+        # Build the whole rendering first, so the dump is a single write.
+        blocked = self.blocked
+        placed = self.placed
+        lines = []
+        for row in range(self.height):
+            line = ''
+            for col in range(self.width):
+                pos = self.linearFromCoord(col, row)
+                if blocked >> pos & 1:
+                    line += '9'
                 else:
-                    sys.stdout.write(chr(c))    # for displaying marks, not number, for debugging
-            sys.stdout.write('\n')
+                    id = 0
+                    for shifted, pieceId in placed.items():
+                        if shifted >> pos & 1:
+                            id = pieceId
+                            break
+                    line += str(id)
+            lines.append(line)
+        sys.stdout.write('\n'.join(lines).translate(BOARD_TBL) + '\n')
 
     ##
      # Get (col,row) of 2D board array from linear increment.
      ##
     def coordFromLinear(self, x):
-        return int(x % self.width), int(x / self.width)
+        row, col = divmod(x, self.width)
+        return col, row
 
     ##
      # Get linear board position (spot) from (col,row) position.
@@ -230,138 +185,260 @@ class Board:
     def linearFromCoord(self, col, row):
         return row * self.width + col
 
-class Piece:
-    pieces = []
-    idx = 0         # use this to itterate through pieces, by 0-based index
-
-    def __init__(self, rows, rotations=4, flips=2):
-        # Save parameters passed in object
-        self.startRows = deepcopy(rows)
-        self.id = len(Piece.pieces) + 1    # 1-based ID value for piece
-        self.rotations = rotations
-        self.flips = flips
-        self.reset()
-        Piece.pieces.append(self)
+##
+ # Rotate a piece mask CCW within its bounding box, permuting only the set bits.
+ # Masks use the board's 7-wide bit layout; source cell (r,c) lands on
+ # (width-1-c, r) in the rotated box, whose bounding box is height x width.
+ # \param mask piece bitmask to rotate
+ # \param width bounding-box width of the mask passed in
+ # \returns the rotated mask
+ ##
+def rotateMask(mask, width):
+    rotated = 0
+    while mask:
+        bit = mask & -mask
+        r, c = divmod(bit.bit_length() - 1, 7)
+        rotated |= 1 << ((width - 1 - c) * 7 + r)
+        mask ^= bit
+    return rotated
 
-    ##
-     # Reset piece to initial state.
-     ##
-    def reset(self):
-        self.rows = deepcopy(self.startRows)
-        self.width = len(self.rows[0])
-        self.height = len(self.rows)
-        self.rotation = 0   # Track current rotation for the piece
+##
+ # Flip a piece mask top to bottom within its bounding box.
+ # \param mask piece bitmask to flip
+ # \param height bounding-box height of the mask passed in
+ # \returns the flipped mask
+ ##
+def flipMask(mask, height):
+    flipped = 0
+    while mask:
+        bit = mask & -mask
+        r, c = divmod(bit.bit_length() - 1, 7)
+        flipped |= 1 << ((height - 1 - r) * 7 + c)
+        mask ^= bit
+    return flipped
 
-    ##
-     # Flip piece top to bottom.
-     ##
-    def flip(self):
-        for y in range(int(len(self.rows) / 2)):     # 2:0, 3:0, 4:0,1
-            tmpRow = self.rows[y]
-            self.rows[y] = self.rows[self.height-y-1]
-            self.rows[self.height-y-1] = tmpRow
+class Piece:
+    __slots__ = ('id', 'width', 'height', 'mask',
+                 'orientations', 'placements', 'covering')
 
-    ##
-     # Rotate piece CCW. The number of rotations should be 4 for pieces that
-     # are not radially symmetrical, or 2 for those that are.
-     # \returns the next rotation enumeration, or zero if all rotations exhausted.
-     ##
-    def rotate(self):
-        # Create new rows, where width is height, heith is width.
-        newRows = [[0]*self.height for i in range(self.width)]
-        # newRows = [[None,None],[None,None],[None,None]]
-
-        # No transpose, rotating CCW.
-        spot = 0
-        for nrnum in range(self.width):
-            for ncnum in range(self.height):
-                c = self.width - nrnum - 1
-                r = ncnum
-                spot = self.rows[r][c]
-                newRows[nrnum][ncnum] = spot
-        self.rows = newRows
-        newWidth = self.height
-        self.height = self.width
-        self.width = newWidth
-        self.rotation = (self.rotation + 1) % self.rotations     # 0=none, 1=CCW once, 2=CCW twice, 3=CCW thrice
-        return self.rotation    # return final rotation - rotates to zero if all rotations exhausted
+    def __init__(self, id, rows):
+        # Save parameters passed in object
+        self.id = id    # 1-based ID value for piece
+        self.width = len(rows[0])
+        self.height = len(rows)
+
+        # Flatten the pattern to a single bytes row and build the base mask
+        # straight from it, using the board's 7-wide bit layout so the mask
+        # can be shifted directly onto the board. No 2D grid outlives the
+        # constructor; all orientation work happens on the mask.
+        width = self.width
+        mask = 0
+        for i, cell in enumerate(bytes(cell for row in rows for cell in row)):
+            if cell:
+                mask |= 1 << (i // width * 7 + i % width)
+        self.mask = mask
+
+        # Precompute every unique orientation as (mask, width, height), so the
+        # solver never rotates or flips pieces while searching. All 4 rotations
+        # of both flips are generated by permuting mask bits directly; any
+        # symmetry of the piece shows up as a duplicate mask and is dropped, so
+        # pieces no longer need hand-maintained rotation/flip counts.
+        self.orientations = []
+        seen = set()
+        mask, width, height = self.mask, self.width, self.height
+        for flip in range(2):
+            for rotation in range(4):
+                if mask not in seen:
+                    seen.add(mask)
+                    self.orientations.append((mask, width, height))
+                mask, width, height = rotateMask(mask, width), height, width
+            mask = flipMask(mask, height)
+
+        # For every orientation, precompute the shifted mask for each location
+        # where the piece stays inside the board rectangle. The solver then
+        # only ever iterates placements that already pass the bounds test.
+        placements = []
+        for mask, width, height in self.orientations:
+            for y0 in range(7 - height + 1):
+                for x0 in range(7 - width + 1):
+                    placements.append(mask << (y0 * 7 + x0))
+        self.placements = tuple(placements)
+
+        # Index the placements by each spot they cover, so the solver can jump
+        # straight to the placements touching the anchor spot instead of
+        # sweeping the whole table for it.
+        covering = [[] for pos in range(49)]
+        for placement in self.placements:
+            spots = placement
+            while spots:
+                bit = spots & -spots
+                covering[bit.bit_length() - 1].append(placement)
+                spots ^= bit
+        self.covering = tuple(tuple(c) for c in covering)
 
     def dump(self):
-        for r in self.rows:
-            for c in r:
-                sys.stdout.write(str(c))
-            sys.stdout.write('\n')
-
-    ##
-     # Get next piece, given piece objects were instantiated in order.
-     # \returns next piece object, or None if no more
-     ##
-    def nextPiece(self):
-        idx = (self.id) % len(Piece.pieces)
-        if idx > 0:
-            return Piece.pieces[idx]
-        else:
-            return None
-
-    @classmethod
-    def dumpAll(cls):
-        for p in Piece.pieces:
-            p.dump()
-            print('='*10)
+        lines = [''.join(str(self.mask >> (y * 7 + x) & 1) for x in range(self.width))
+                 for y in range(self.height)]
+        sys.stdout.write('\n'.join(lines).translate(PIECE_TBL) + '\n')
 
-    @classmethod
-    def firstPiece(cls):
-        Piece.idx = 0
-        return Piece.pieces[Piece.idx]
+##
+ # Bitset of spot counts that some subset of the given pieces can exactly
+ # cover: bit N is set when a subset covers N spots. Cached by the remaining-
+ # piece bit set, since the same subsets recur throughout the search.
+ ##
+sumsCache = {}      # remaining-piece bits -> achievable-sum bitset
+def achievableSums(pieces, remaining):
+    sums = sumsCache.get(remaining)
+    if sums is None:
+        sums = 1    # bit 0: the empty subset covers no spots
+        for piece in pieces:
+            sums |= sums << piece.mask.bit_count()
+        sumsCache[remaining] = sums
+    return sums
+
+failedStates = set()        # (board mask, remaining-piece bits) states proven unsolvable
+FAILED_STATES_MAX = 1 << 20 # stop recording dead ends past this, to bound memory
 
-    @classmethod
-    def numPieces(cls):
-        return len(Piece.pieces)
+##
+ # Generate the candidate placements for one search level: every placement of
+ # every remaining piece that covers the lowest empty spot and misses the
+ # current board.
+ # \yields (piece, placement mask, pieces left after this one, their fillable-size bitset)
+ ##
+def candidates(board, pieces, remaining):
+    # Isolate the lowest empty spot on the board.
+    boardMask = board.mask
+    free = ~boardMask & board.full
+    anchor = (free & -free).bit_length() - 1
+
+    for i, piece in enumerate(pieces):
+        rest = pieces[:i] + pieces[i+1:]
+        sums = achievableSums(rest, remaining & ~(1 << piece.id))
+
+        # Look up the placements covering the anchor spot and filter them
+        # against the current board in one comprehension pass; the board always
+        # returns to the same mask between placements at this level, so the
+        # list stays valid.
+        for placement in [m for m in piece.covering[anchor] if not m & boardMask]:
+            yield piece, placement, rest, sums
 
 ##
- # Recursive function to try all placements and rotations for a given piece.
+ # Search for a placement of every piece covering the lowest empty spot at each
+ # level. Any solution must cover that spot with some remaining piece, so trying
+ # only the placements that include it prunes every redundant placement order.
  # \param board board object to receive the pieces
- # \param piece next piece to place
+ # \param pieces tuple of pieces not yet placed
  # \returns True when last piece has been placed
  ##
-recurse = 0
-def fit(board, piece):
-    global recurse
-    recurse += 1
-    # print(recurse)
-    for pos in range(board.locations):
-        piece.reset()   # reset piece back to its initial rotation
-        for flip in range(piece.flips):
-            for rotation in range(piece.rotations):
-                if board.place(piece, pos):
-                    if not quiet:
-                        if piece.id == 1:
-                            # os.system('clear')
-                            print('=======')
-                            board.dump()
-                    nextPiece = piece.nextPiece()
-                    if nextPiece:
-                        if fit(board, nextPiece):
-                            recurse -= 1
-                            return True
-                        else:
-                            # Remove from board before trying more places and rotations.
-                            board.remove(piece, pos)
-                            piece.rotate()
-                    else:
-                        recurse -= 1
-                        return True    # No more pieces to place
-                else:
-                    # Piece could not be placed, due to fit on board, or overlap.
-                    # Go to next rotation.
-                    piece.rotate()
-            piece.flip()
-    # All positions and rotations tried: got up a level and try again.
-    recurse -= 1
+def fit(board, pieces):
+    remaining = 0
+    for piece in pieces:
+        remaining |= 1 << piece.id
+    key = (board.mask, remaining)
+    if key in failedStates:
+        return False
+
+    # Bind the per-node calls to locals once, so the loop body skips the
+    # attribute lookups CPython would otherwise repeat on every placement.
+    place = board.place
+    remove = board.remove
+    failed = failedStates
+
+    # Explicit search stack instead of recursion, to skip the Python call-frame
+    # cost per node. Each level holds its memo key, its half-consumed candidate
+    # iterator, and the placement that was applied to enter the level, so the
+    # level can be memoized and backed out when its candidates run dry.
+    stack = [(key, candidates(board, pieces, remaining), 0)]
+    while stack:
+        key, cands, entered = stack[-1]
+        descended = False
+        for piece, placement, rest, sums in cands:
+            shifted = place(piece, placement, sums)
+            if not shifted:
+                continue
+            if DEBUG:
+                if piece.id == 1:
+                    print('=======')
+                    board.dump()
+            if not rest:
+                return True    # No more pieces to place
+            restBits = key[1] & ~(1 << piece.id)
+            childKey = (board.mask, restBits)
+            if childKey in failed:
+                # Known dead end: back the placement out and try the next one.
+                remove(shifted)
+                continue
+            stack.append((childKey, candidates(board, rest, restBits), shifted))
+            descended = True
+            break
+        if not descended:
+            # All placements tried: remember the dead end, back out the
+            # placement that entered this level, and go up a level to try again.
+            if len(failed) < FAILED_STATES_MAX:
+                failed.add(key)
+            stack.pop()
+            if entered:
+                remove(entered)
     return False
 
+##
+ # Build the set of pieces used by the puzzle. Initial orientation for each is arbitrary.
+ ##
+def makePieces():
+    pieces = \
+        ( \
+            Piece(1, [[1,0,1],[1,1,1]]), \
+            Piece(2, [[0,0,1],[1,1,1],[1,0,0]]), \
+            Piece(3, [[1,1,1],[1,0,0],[1,0,0]]), \
+            Piece(4, [[0,0,1,1],[1,1,1,0]]), \
+            Piece(5, [[1,1,1,1],[1,0,0,0]]), \
+            Piece(6, [[1,1,1,1],[0,0,1,0]]), \
+            Piece(7, [[1,1,1],[0,1,1]]), \
+            Piece(8, [[1,1,1],[1,1,1]]), \
+        )
+
+    # Try the most constrained pieces first - most cells covered, then fewest
+    # placements - so failing subtrees are cut off nearer the root.
+    return tuple(sorted(pieces, key=lambda p: (-p.mask.bit_count(), len(p.placements))))
+
+##
+ # Search the subtree under one starting placement of the first piece.
+ # Worker for the parallel search - each legal placement of the first piece
+ # roots an independent subtree, so subtrees can run on separate cores.
+ # \param args (month, day, placement mask for the first piece)
+ # \returns the solved board, or None if the subtree has no solution
+ ##
+def solveFrom(args):
+    month, day, placement = args
+    board = Board(month, day)
+    pieces = makePieces()
+    failedStates.clear()
+    rest = pieces[1:]
+    restBits = 0
+    for piece in rest:
+        restBits |= 1 << piece.id
+    shifted = board.place(pieces[0], placement, achievableSums(rest, restBits))
+    if shifted and fit(board, rest):
+        return board
+    return None
+
+##
+ # Solve the puzzle for one date, reusing an already-built piece set so batch
+ # callers pay for the placement precompute only once.
+ # \param month 1-based month
+ # \param day 1-based day of month
+ # \param pieces piece tuple from makePieces()
+ # \returns (solved board or None, elapsed seconds)
+ ##
+def solve(month, day, pieces):
+    startTime = time.time()
+    board = Board(month, day)
+    failedStates.clear()
+    if fit(board, pieces):
+        return board, time.time() - startTime
+    return None, time.time() - startTime
+
 def main():
-    global quiet
     global gonogo
     MONTH_STR = ['Jan', 'Feb', 'Mar', 'Apr', 'May', 'Jun', 'Jul', 'Aug', 'Sep', 'Oct', 'Nov', 'Dec']
 
@@ -380,42 +457,40 @@ def main():
         month = dt.month
         day = dt.day
 
-    if 'quiet' in sys.argv:
-        quiet = True
-
     if 'gonogo' in sys.argv:
         gonogo = True
-        quiet = True
 
     if not gonogo:
         print('Solving for {} {}'.format(MONTH_STR[month-1], day))
 
-    startTime = time.time()
-
-    board = Board(month, day)
-
-    # Establish all pieces used. Initial orientation for each is arbitrary.
-    piece = \
-        [ \
-            Piece([[1,0,1],[1,1,1]], rotations=4, flips=1), \
-            Piece([[0,0,1],[1,1,1],[1,0,0]], rotations=2, flips=2), \
-            Piece([[1,1,1],[1,0,0],[1,0,0]], rotations=4, flips=1), \
-            Piece([[0,0,1,1],[1,1,1,0]], rotations=4, flips=2), \
-            Piece([[1,1,1,1],[1,0,0,0]], rotations=4, flips=2), \
-            Piece([[1,1,1,1],[0,0,1,0]], rotations=4, flips=2), \
-            Piece([[1,1,1],[0,1,1]], rotations=4, flips=2), \
-            Piece([[1,1,1],[1,1,1]], rotations=2, flips=1), \
-        ]
+    pieces = makePieces()
 
     try:
-        if fit(board, piece[0]):
+        if 'par' in sys.argv:
+            # Split the search at the root: every legal starting placement of
+            # the first piece runs as an independent subtree on its own core.
+            startTime = time.time()
+            board = None
+            jobs = [(month, day, placement) for placement in pieces[0].placements]
+            pool = multiprocessing.Pool()
+            for result in pool.imap_unordered(solveFrom, jobs):
+                if result:
+                    board = result
+                    break
+            pool.terminate()
+            pool.join()
+            elapsed = time.time() - startTime
+        else:
+            board, elapsed = solve(month, day, pieces)
+
+        if board:
             if not gonogo:
-                print('\nSolution found in {:.01f}s:'.format(time.time() - startTime))
+                print('\nSolution found in {:.01f}s:'.format(elapsed))
                 board.dump()
             else:
-                print('{}: solved in {:.01f}s'.format(dt.strftime('%m/%d/%Y'), time.time() - startTime))
+                print('{:02d}/{:02d}: solved in {:.01f}s'.format(month, day, elapsed))
         else:
-            print('{}: No solution found ({:.01f}s)'.format(dt.strftime('%m/%d/%Y'), time.time() - startTime))
+            print('{:02d}/{:02d}: No solution found ({:.01f}s)'.format(month, day, elapsed))
     except KeyboardInterrupt:
         print('\nStopped')
 
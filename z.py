@@ -0,0 +1,50 @@
+#!/usr/bin/python3
+
+##
+ # Batch driver: solve every date of the year across all CPU cores, and report
+ # a go/no-go line per date. Each worker process builds the precomputed piece
+ # set once and reuses it for every date it is handed.
+ ##
+
+import multiprocessing
+import time
+
+import calpuz
+
+DAYS_IN_MONTH = [31, 29, 31, 30, 31, 30, 31, 31, 30, 31, 30, 31]
+
+pieces = None
+
+def initWorker():
+    global pieces
+    pieces = calpuz.makePieces()
+
+##
+ # Solve one (month, day) in a worker process.
+ # \returns (month, day, solved flag, seconds spent in the search)
+ ##
+def solveDate(date):
+    month, day = date
+    board, elapsed = calpuz.solve(month, day, pieces)
+    return month, day, board is not None, elapsed
+
+def main():
+    startTime = time.time()
+    dates = [(month, day) for month in range(1, 13)
+             for day in range(1, DAYS_IN_MONTH[month - 1] + 1)]
+
+    total = 0.0
+    unsolved = 0
+    with multiprocessing.Pool(initializer=initWorker) as pool:
+        for month, day, solved, elapsed in pool.imap(solveDate, dates, chunksize=4):
+            total += elapsed
+            if solved:
+                print('{:02d}/{:02d}: solved in {:.01f}s'.format(month, day, elapsed))
+            else:
+                unsolved += 1
+                print('{:02d}/{:02d}: No solution found ({:.01f}s)'.format(month, day, elapsed))
+    print('{} dates unsolved, {:.01f}s search time, {:.01f}s wall'.format(
+        unsolved, total, time.time() - startTime))
+
+if __name__ == "__main__":
+    main()